@@ -9,7 +9,8 @@ import sys
 import os
 
 # Add utils to path
-sys.path.insert(0, os.path.dirname(__file__))
+if os.path.dirname(__file__) not in sys.path:
+    sys.path.insert(0, os.path.dirname(__file__))
 
 from utils.database import get_db
 from utils.config import SUPPORTED_NETWORKS
@@ -22,8 +23,7 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Styles CSS personnalisés
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -33,20 +33,28 @@ st.markdown("""
         -webkit-text-fill-color: transparent;
         margin-bottom: 1rem;
     }
-    .status-active {
-        color: #00ff88;
-        font-weight: bold;
-    }
-    .status-inactive {
-        color: #ff4444;
-        font-weight: bold;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Styles CSS personnalisés
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # Database
 db = get_db()
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_wallet_value(address: str, network: str, version: int) -> float:
+    """USD value of a wallet, cached so sidebar widget reruns skip the RPC calls
+    (refetched once the database is written, see Database.data_version)"""
+    from utils.balance import get_all_balances, get_prices
+    balances = get_all_balances(address, network)
+    if not balances:
+        return 0
+    prices = get_prices([b.symbol for b in balances])
+    return sum(b.balance * prices.get(b.symbol, 0) for b in balances)
+
+
 # Sidebar
 with st.sidebar:
     st.image("https://img.icons8.com/fluency/96/rocket.png", width=80)
@@ -86,13 +94,7 @@ active_wallet = db.get_active_wallet()
 total_value = 0
 if active_wallet:
     try:
-        from utils.balance import get_all_balances, get_prices
-        balances = get_all_balances(active_wallet.address, active_wallet.network)
-        if balances:
-            symbols = [b.symbol for b in balances]
-            prices = get_prices(symbols)
-            for b in balances:
-                total_value += b.balance * prices.get(b.symbol, 0)
+        total_value = _fetch_wallet_value(active_wallet.address, active_wallet.network, db.data_version)
     except Exception:
         pass
 
@@ -5,25 +5,37 @@ Vue globale de tous les wallets et status
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 
 # Add utils to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 from utils.database import get_db
 from utils.config import load_config, SUPPORTED_NETWORKS
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    from utils.balance import get_all_balances, get_prices
+    BALANCE_AVAILABLE = True
+except ImportError:
+    BALANCE_AVAILABLE = False
+
 st.set_page_config(
     page_title="🏠 Dashboard | SmallCap Trader",
     page_icon="🏠",
     layout="wide"
 )
 
-# ========== STYLES ==========
-st.markdown("""
+STRATEGY_TYPE_ICONS = {'DCA': '📊', 'GRID': '📐', 'LIMIT': '🎯', 'SNIPER': '🔫'}
+TRADE_TYPE_ICONS = {'buy': '🟢', 'sell': '🔴', 'swap': '🔄'}
+STATUS_ICONS = {'pending': '⏳', 'confirmed': '✅', 'failed': '❌'}
+
+DASHBOARD_CSS = """
 <style>
     .main-title {
         font-size: 2.2rem;
@@ -33,22 +45,82 @@ st.markdown("""
         -webkit-text-fill-color: transparent;
         margin-bottom: 0.5rem;
     }
-    .wallet-card {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 1.2rem;
-        border: 1px solid #333366;
-        margin-bottom: 0.5rem;
-    }
-    .profit-green { color: #00ff88 !important; }
-    .loss-red { color: #ff4757 !important; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# ========== STYLES ==========
+st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
 
 # ========== DATABASE & CONFIG ==========
 db = get_db()
 config = load_config()
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_wallets(version: int):
+    """Wallets list, cached across reruns until the database is written (`version`)"""
+    return get_db().get_wallets()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_portfolio_stats(version: int):
+    """Aggregate counters, cached across reruns until the database is written"""
+    return get_db().get_portfolio_stats()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_paper_trades(version: int):
+    """Paper trades from the simulation file, cached until the file changes"""
+    return get_db().get_paper_trades()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_recent_trades(version: int, limit: int = 10):
+    """Latest trades, cached across reruns until the database is written"""
+    return get_db().get_trades(limit=limit)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_wallet_holdings(address: str, network: str, version: int):
+    """On-chain balances, prices and USD value of one wallet (None if empty),
+    refetched once the database is written"""
+    balances = get_all_balances(address, network)
+    if not balances:
+        return None
+    prices = get_prices([b.symbol for b in balances])
+    return {
+        'balances': balances,
+        'prices': prices,
+        'total_value': sum(b.balance * prices.get(b.symbol, 0) for b in balances)
+    }
+
+
+CACHED_FETCHES = (
+    _fetch_wallets, _fetch_portfolio_stats, _fetch_paper_trades, _fetch_recent_trades,
+    _fetch_wallet_holdings
+)
+
+
+@st.cache_resource(max_entries=4)
+def _allocation_figure(tokens: tuple, values: tuple):
+    """Portfolio allocation donut, built once per distinct allocation"""
+    import plotly.express as px  # heavy; only imported when a chart is drawn
+    
+    fig = px.pie(
+        values=values,
+        names=tokens,
+        color_discrete_sequence=['#667eea', '#00b894', '#fdcb6e', '#e17055', '#74b9ff', '#636e72'],
+        hole=0.4
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=350,
+        showlegend=True
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
 # ========== HEADER ==========
 col_header, col_refresh = st.columns([4, 1])
 
@@ -58,42 +130,44 @@ with col_header:
 
 with col_refresh:
     if st.button("🔄 Rafraîchir", use_container_width=True):
+        for fetch in CACHED_FETCHES:
+            fetch.clear()
         st.rerun()
 
 st.markdown("---")
 
 # ========== FETCH REAL DATA ==========
-wallets = db.get_wallets()
-stats = db.get_portfolio_stats()
-paper_trades = db.get_paper_trades()
-recent_trades = db.get_trades(limit=10)
+data_version = db.data_version  # one snapshot for every cached read below
+wallets = _fetch_wallets(data_version)
+stats = _fetch_portfolio_stats(data_version)
+paper_trades = _fetch_paper_trades(db.paper_version)
+recent_trades = _fetch_recent_trades(data_version, limit=10)
 
 # Calculate real portfolio value
 total_portfolio_value = 0
 wallet_balances = {}
 
-try:
-    from utils.balance import get_all_balances, get_prices
-    BALANCE_AVAILABLE = True
-except ImportError:
-    BALANCE_AVAILABLE = False
-
 if BALANCE_AVAILABLE and wallets:
-    for wallet in wallets:
+    # RPC + CoinGecko round-trips, one worker per wallet: a cold load waits for the
+    # slowest wallet, not their sum (workers share the script context for st.cache_data)
+    with ThreadPoolExecutor(
+        max_workers=min(len(wallets), 8),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as pool:
+        pending = {
+            wallet.id: pool.submit(_fetch_wallet_holdings, wallet.address, wallet.network, data_version)
+            for wallet in wallets
+        }
+    
+    for wallet_id, future in pending.items():
         try:
-            balances = get_all_balances(wallet.address, wallet.network)
-            if balances:
-                symbols = [b.symbol for b in balances]
-                prices = get_prices(symbols)
-                wallet_value = sum(b.balance * prices.get(b.symbol, 0) for b in balances)
-                wallet_balances[wallet.id] = {
-                    'balances': balances,
-                    'prices': prices,
-                    'total_value': wallet_value
-                }
-                total_portfolio_value += wallet_value
+            holdings = future.result()
+            if holdings:
+                wallet_balances[wallet_id] = holdings
+                total_portfolio_value += holdings['total_value']
         except Exception:
-            wallet_balances[wallet.id] = {'balances': [], 'prices': {}, 'total_value': 0}
+            wallet_balances[wallet_id] = {'balances': [], 'prices': {}, 'total_value': 0}
 
 # Row 1: Métriques principales
 col1, col2, col3, col4 = st.columns(4)
@@ -109,14 +183,14 @@ with col2:
     st.metric(
         label="👛 Wallets",
         value=str(stats['total_wallets']),
-        delta=f"{len([w for w in wallets if w.is_active])} actif" if wallets else None
+        delta=f"{stats['active_wallets']} actif" if wallets else None
     )
 
 with col3:
     st.metric(
         label="📝 Paper Trading",
-        value=str(stats['paper_trades']),
-        delta="En cours" if stats['paper_trades'] > 0 else "Aucune"
+        value=str(len(paper_trades)),
+        delta="En cours" if paper_trades else "Aucune"
     )
 
 with col4:
@@ -132,36 +206,33 @@ st.markdown("---")
 st.subheader("👛 Wallets")
 
 if wallets:
+    # One table for all wallets instead of a row of widgets per wallet
+    rows = []
     for wallet in wallets:
         wallet_data = wallet_balances.get(wallet.id, {'total_value': 0, 'balances': []})
-        balance_value = wallet_data['total_value']
         balances = wallet_data.get('balances', [])
-        
-        with st.container():
-            col_info, col_balance, col_tokens, col_action = st.columns([3, 2, 3, 1])
-            
-            with col_info:
-                network_icon = SUPPORTED_NETWORKS.get(wallet.network, {}).get('icon', '🔗')
-                status_icon = "🟢" if wallet.is_active else "⚪"
-                st.markdown(f"**{status_icon} {wallet.name}**")
-                st.caption(f"{network_icon} {wallet.network.upper()} | `{wallet.address[:10]}...{wallet.address[-6:]}`")
-            
-            with col_balance:
-                st.metric("Balance", f"${balance_value:,.2f}")
-            
-            with col_tokens:
-                if balances:
-                    prices = wallet_data.get('prices', {})
-                    tokens_str = ", ".join([f"{b.symbol}: {b.balance:.4f}" for b in balances[:3]])
-                    st.caption(f"🪙 {tokens_str}")
-                else:
-                    st.caption("📭 Aucun token")
-            
-            with col_action:
-                if st.button("👁️", key=f"view_{wallet.id}", help="Voir détails"):
-                    st.switch_page("pages/1_wallet.py")
-        
-        st.markdown("---")
+        network_icon = SUPPORTED_NETWORKS.get(wallet.network, {}).get('icon', '🔗')
+        rows.append({
+            'Statut': "🟢" if wallet.is_active else "⚪",
+            'Wallet': wallet.name,
+            'Réseau': f"{network_icon} {wallet.network.upper()}",
+            'Adresse': f"{wallet.address[:10]}...{wallet.address[-6:]}",
+            'Balance': wallet_data['total_value'],
+            'Tokens': ", ".join(f"{b.symbol}: {b.balance:.4f}" for b in balances[:3]) or "📭 Aucun token",
+        })
+    
+    st.dataframe(
+        pd.DataFrame(rows),
+        column_config={
+            "Statut": st.column_config.TextColumn("", width="small"),
+            "Balance": st.column_config.NumberColumn("💰 Balance", format="$%.2f"),
+            "Tokens": st.column_config.TextColumn("🪙 Tokens"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    if st.button("👁️ Voir les détails", key="view_wallets"):
+        st.switch_page("pages/1_wallet.py")
 else:
     st.info("👛 Aucun wallet configuré.")
     if st.button("➕ Ajouter un Wallet", use_container_width=True):
@@ -172,36 +243,22 @@ if total_portfolio_value > 0 and BALANCE_AVAILABLE:
     st.subheader("🪙 Allocation du Portfolio")
     
     # Aggregate all tokens across wallets
-    all_tokens = {}
-    for wallet_id, data in wallet_balances.items():
-        for b in data.get('balances', []):
-            price = data['prices'].get(b.symbol, 0)
-            value = b.balance * price
-            if b.symbol in all_tokens:
-                all_tokens[b.symbol] += value
-            else:
-                all_tokens[b.symbol] = value
+    holdings = pd.DataFrame(
+        [
+            (b.symbol, b.balance * data['prices'].get(b.symbol, 0))
+            for data in wallet_balances.values()
+            for b in data.get('balances', [])
+        ],
+        columns=['Token', 'Valeur']
+    )
     
-    if all_tokens:
-        allocation_data = pd.DataFrame({
-            'Token': list(all_tokens.keys()),
-            'Valeur': list(all_tokens.values())
-        })
+    if not holdings.empty:
+        allocation_data = holdings.groupby('Token', as_index=False, sort=False)['Valeur'].sum()
         
-        fig_pie = px.pie(
-            allocation_data,
-            values='Valeur',
-            names='Token',
-            color_discrete_sequence=['#667eea', '#00b894', '#fdcb6e', '#e17055', '#74b9ff', '#636e72'],
-            hole=0.4
-        )
-        fig_pie.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            height=350,
-            showlegend=True
+        fig_pie = _allocation_figure(
+            tuple(allocation_data['Token']),
+            tuple(allocation_data['Valeur'].round(2))
         )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
         st.plotly_chart(fig_pie, use_container_width=True)
 
 # ========== STRATEGIES ACTIVES ==========
@@ -212,17 +269,12 @@ with col_strats:
     st.subheader("📝 Paper Trading")
     
     if paper_trades:
+        wallets_by_id = {w.id: w for w in wallets}
         for strategy in paper_trades:
-            wallet = next((w for w in wallets if w.id == strategy.wallet_id), None)
+            wallet = wallets_by_id.get(strategy.wallet_id)
             wallet_name = wallet.name if wallet else "N/A"
             
-            type_icons = {
-                'DCA': '📊',
-                'GRID': '📐',
-                'LIMIT': '🎯',
-                'SNIPER': '🔫',
-            }
-            icon = type_icons.get(strategy.strategy_type.upper(), '🤖')
+            icon = STRATEGY_TYPE_ICONS.get(strategy.strategy_type.upper(), '🤖')
             
             last_run_str = strategy.last_run.strftime("%H:%M:%S") if strategy.last_run else "Jamais"
             
@@ -244,21 +296,15 @@ with col_trades:
     st.subheader("📜 Derniers Trades")
     
     if recent_trades:
-        for trade in recent_trades[:7]:
-            trade_type = trade.get('trade_type', 'swap')
-            token_in = trade.get('token_in', '?')
-            token_out = trade.get('token_out', '?')
-            amount = trade.get('amount_in', '0')
-            status = trade.get('status', 'pending')
-            
-            status_icons = {'pending': '⏳', 'confirmed': '✅', 'failed': '❌'}
-            type_colors = {'buy': '🟢', 'sell': '🔴', 'swap': '🔄'}
-            
-            cols = st.columns([1, 3, 2, 1])
-            cols[0].write(type_colors.get(trade_type, '🔄'))
-            cols[1].markdown(f"**{token_in} → {token_out}**")
-            cols[2].caption(amount)
-            cols[3].write(status_icons.get(status, '⏳'))
+        # One table instead of a row of widgets per trade; columns formatted vectorized
+        raw = pd.DataFrame.from_records(recent_trades[:7])
+        trades_df = pd.DataFrame({
+            'Type': raw['trade_type'].map(TRADE_TYPE_ICONS).fillna('🔄'),
+            'Paire': raw['token_in'].fillna('?') + ' → ' + raw['token_out'].fillna('?'),
+            'Montant': raw['amount_in'].fillna('0'),
+            'Statut': raw['status'].map(STATUS_ICONS).fillna('⏳'),
+        })
+        st.dataframe(trades_df, use_container_width=True, hide_index=True)
     else:
         st.info("📭 Aucun trade enregistré")
         st.caption("Les trades apparaîtront ici une fois que le bot sera actif")
@@ -8,7 +8,9 @@ from datetime import datetime
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 from utils.database import get_db, WalletRecord
 from utils.config import load_config, save_config, SUPPORTED_NETWORKS, AI_PROFILES
 from utils.llm_providers import get_available_providers, LLM_MODELS
@@ -42,120 +44,126 @@ MARKET_CAP_PRESETS = {
 }
 
 # ========== LISTE DES WALLETS ==========
-wallets = db.get_wallets()
-
-if wallets:
-    for wallet in wallets:
-        # Get wallet config
-        wallet_cfg = config.trading.wallets.get(wallet.address, {})
+@st.fragment
+def _render_wallet_card(wallet):
+    """Settings card for one wallet: its selectboxes only rerun this card"""
+    # Get wallet config
+    wallet_cfg = config.trading.wallets.get(wallet.address, {})
+    
+    with st.container():
+        # Header
+        status = "🟢" if wallet.is_active else "⚪"
+        st.markdown(f"### {status} {wallet.name}")
+        st.caption(f"`{wallet.address}`")
         
-        with st.container():
-            # Header
-            status = "🟢" if wallet.is_active else "⚪"
-            st.markdown(f"### {status} {wallet.name}")
-            st.caption(f"`{wallet.address}`")
-            
-            # 4 columns for 4 settings
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                # 1. Profil de risque
-                current_profile = wallet_cfg.get('ai_profile', 'modere')
-                new_profile = st.selectbox(
-                    "🎯 Profil Risque",
-                    options=list(AI_PROFILES.keys()),
-                    format_func=lambda x: AI_PROFILES[x].name,
-                    index=list(AI_PROFILES.keys()).index(current_profile) if current_profile in AI_PROFILES else 1,
-                    key=f"profile_{wallet.id}"
-                )
+        # 4 columns for 4 settings
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            # 1. Profil de risque
+            current_profile = wallet_cfg.get('ai_profile', 'modere')
+            new_profile = st.selectbox(
+                "🎯 Profil Risque",
+                options=list(AI_PROFILES.keys()),
+                format_func=lambda x: AI_PROFILES[x].name,
+                index=list(AI_PROFILES.keys()).index(current_profile) if current_profile in AI_PROFILES else 1,
+                key=f"profile_{wallet.id}"
+            )
+        
+        with col2:
+            # 2. Modèle IA
+            current_provider = wallet_cfg.get('llm_provider', 'openclaw')
+            provider_list = list(available_providers.keys()) if available_providers else ['openclaw']
             
-            with col2:
-                # 2. Modèle IA
-                current_provider = wallet_cfg.get('llm_provider', 'openclaw')
-                provider_list = list(available_providers.keys()) if available_providers else ['openclaw']
+            new_provider = st.selectbox(
+                "🤖 Modèle IA",
+                options=provider_list,
+                format_func=lambda x: LLM_MODELS.get(x, {}).get('name', x),
+                index=provider_list.index(current_provider) if current_provider in provider_list else 0,
+                key=f"provider_{wallet.id}"
+            )
+        
+        with col3:
+            # 3. Market Cap Range
+            current_mcap = wallet_cfg.get('market_cap_preset', 'small_cap')
+            new_mcap = st.selectbox(
+                "💰 Market Cap",
+                options=list(MARKET_CAP_PRESETS.keys()),
+                format_func=lambda x: MARKET_CAP_PRESETS[x]['name'],
+                index=list(MARKET_CAP_PRESETS.keys()).index(current_mcap) if current_mcap in MARKET_CAP_PRESETS else 1,
+                key=f"mcap_{wallet.id}"
+            )
+        
+        with col4:
+            # 4. Blockchain
+            current_network = wallet.network
+            new_network = st.selectbox(
+                "⛓️ Blockchain",
+                options=list(SUPPORTED_NETWORKS.keys()),
+                format_func=lambda x: f"{SUPPORTED_NETWORKS[x]['icon']} {SUPPORTED_NETWORKS[x]['name']}",
+                index=list(SUPPORTED_NETWORKS.keys()).index(current_network) if current_network in SUPPORTED_NETWORKS else 0,
+                key=f"network_{wallet.id}"
+            )
+        
+        # Save button
+        col_save, col_status, col_delete = st.columns([1, 2, 1])
+        
+        with col_save:
+            if st.button("💾 Sauvegarder", key=f"save_{wallet.id}", type="primary"):
+                # Update config
+                if wallet.address not in config.trading.wallets:
+                    config.trading.wallets[wallet.address] = {}
                 
-                new_provider = st.selectbox(
-                    "🤖 Modèle IA",
-                    options=provider_list,
-                    format_func=lambda x: LLM_MODELS.get(x, {}).get('name', x),
-                    index=provider_list.index(current_provider) if current_provider in provider_list else 0,
-                    key=f"provider_{wallet.id}"
-                )
-            
-            with col3:
-                # 3. Market Cap Range
-                current_mcap = wallet_cfg.get('market_cap_preset', 'small_cap')
-                new_mcap = st.selectbox(
-                    "💰 Market Cap",
-                    options=list(MARKET_CAP_PRESETS.keys()),
-                    format_func=lambda x: MARKET_CAP_PRESETS[x]['name'],
-                    index=list(MARKET_CAP_PRESETS.keys()).index(current_mcap) if current_mcap in MARKET_CAP_PRESETS else 1,
-                    key=f"mcap_{wallet.id}"
-                )
-            
-            with col4:
-                # 4. Blockchain
-                current_network = wallet.network
-                new_network = st.selectbox(
-                    "⛓️ Blockchain",
-                    options=list(SUPPORTED_NETWORKS.keys()),
-                    format_func=lambda x: f"{SUPPORTED_NETWORKS[x]['icon']} {SUPPORTED_NETWORKS[x]['name']}",
-                    index=list(SUPPORTED_NETWORKS.keys()).index(current_network) if current_network in SUPPORTED_NETWORKS else 0,
-                    key=f"network_{wallet.id}"
-                )
-            
-            # Save button
-            col_save, col_status, col_delete = st.columns([1, 2, 1])
-            
-            with col_save:
-                if st.button("💾 Sauvegarder", key=f"save_{wallet.id}", type="primary"):
-                    # Update config
-                    if wallet.address not in config.trading.wallets:
-                        config.trading.wallets[wallet.address] = {}
-                    
-                    config.trading.wallets[wallet.address].update({
-                        'name': wallet.name,
-                        'ai_profile': new_profile,
-                        'llm_provider': new_provider,
-                        'market_cap_preset': new_mcap,
-                        'network': new_network,
-                        'enabled': True
-                    })
-                    save_config(config)
-                    
-                    # Update network in DB if changed
-                    if new_network != wallet.network:
-                        db.cursor.execute(
-                            "UPDATE wallets SET network = ? WHERE id = ?",
-                            (new_network, wallet.id)
-                        )
-                        db.conn.commit()
-                    
-                    st.success("✅ Sauvegardé!")
+                config.trading.wallets[wallet.address].update({
+                    'name': wallet.name,
+                    'ai_profile': new_profile,
+                    'llm_provider': new_provider,
+                    'market_cap_preset': new_mcap,
+                    'network': new_network,
+                    'enabled': True
+                })
+                save_config(config)
+                
+                # Update network in DB if changed
+                if new_network != wallet.network:
+                    db.cursor.execute(
+                        "UPDATE wallets SET network = ? WHERE id = ?",
+                        (new_network, wallet.id)
+                    )
+                    db.conn.commit()
+                
+                st.success("✅ Sauvegardé!")
+                st.rerun()
+        
+        with col_status:
+            # Show current config summary
+            profile_info = AI_PROFILES.get(new_profile, AI_PROFILES['modere'])
+            mcap_info = MARKET_CAP_PRESETS.get(new_mcap, MARKET_CAP_PRESETS['small_cap'])
+            st.caption(f"Score min: {profile_info.min_score} | {mcap_info['name']}")
+        
+        with col_delete:
+            if not wallet.is_active:
+                if st.button("✅ Activer", key=f"activate_{wallet.id}"):
+                    db.set_active_wallet(wallet.id)
                     st.rerun()
-            
-            with col_status:
-                # Show current config summary
-                profile_info = AI_PROFILES.get(new_profile, AI_PROFILES['modere'])
-                mcap_info = MARKET_CAP_PRESETS.get(new_mcap, MARKET_CAP_PRESETS['small_cap'])
-                st.caption(f"Score min: {profile_info.min_score} | {mcap_info['name']}")
-            
-            with col_delete:
-                if not wallet.is_active:
-                    if st.button("✅ Activer", key=f"activate_{wallet.id}"):
-                        db.set_active_wallet(wallet.id)
-                        st.rerun()
-                else:
-                    st.caption("✅ Actif")
-            
-            st.markdown("---")
+            else:
+                st.caption("✅ Actif")
+        
+        st.markdown("---")
+
+
+wallets = db.get_wallets()
+
+if wallets:
+    for wallet in wallets:
+        _render_wallet_card(wallet)
 else:
     st.info("📭 Aucun wallet configuré")
 
 # ========== AJOUTER UN WALLET ==========
-st.subheader("➕ Ajouter un Wallet")
-
-if WALLET_AVAILABLE:
+@st.fragment
+def _render_add_wallet_form():
+    """Generate/import tabs: typing in them only reruns this form"""
     with st.expander("Créer ou importer un wallet"):
         tab1, tab2 = st.tabs(["🎰 Générer", "📥 Importer"])
         
@@ -211,6 +219,12 @@ if WALLET_AVAILABLE:
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Erreur: {e}")
+
+
+st.subheader("➕ Ajouter un Wallet")
+
+if WALLET_AVAILABLE:
+    _render_add_wallet_form()
 else:
     st.warning("⚠️ `eth-account` non installé")
 
@@ -5,11 +5,14 @@ Suivi et analyse des trades passés
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 from utils.database import get_db
 
 st.set_page_config(
@@ -18,14 +21,29 @@ st.set_page_config(
     layout="wide"
 )
 
+STATUS_ICONS = {'confirmed': '✅', 'pending': '⏳', 'failed': '❌'}
+PAGE_SIZE = 25
+
 db = get_db()
 
+
+@st.cache_data(ttl=30)
+def _fetch_trades(limit: int = PAGE_SIZE, offset: int = 0):
+    """One page of trades, cached across reruns (cleared after a manual insert)"""
+    return get_db().get_trades(limit=limit, offset=offset)
+
+
+@st.cache_data(ttl=30)
+def _fetch_trade_stats():
+    """Trade counters, cached with the same TTL as the pages they paginate"""
+    return get_db().get_trade_stats()
+
+
 st.title("📈 Historique des Trades")
 st.markdown("Analysez vos performances de trading")
 
-# Fetch real trades
-trades = db.get_trades(limit=100)
-stats = db.get_portfolio_stats()
+# Counters first: the total drives the pagination below
+stats = _fetch_trade_stats()
 
 # Stats
 st.markdown("---")
@@ -48,31 +66,36 @@ st.markdown("---")
 # Trades list
 st.subheader("📜 Liste des Trades")
 
-if trades:
-    # Convert to dataframe
-    trades_data = []
-    for trade in trades:
-        trades_data.append({
-            'Date': trade.get('created_at', 'N/A'),
-            'Type': trade.get('trade_type', 'swap').upper(),
-            'Token In': trade.get('token_in', '?'),
-            'Token Out': trade.get('token_out', '?'),
-            'Amount In': trade.get('amount_in', '0'),
-            'Amount Out': trade.get('amount_out', '0'),
-            'Status': trade.get('status', 'pending'),
-            'TX Hash': trade.get('tx_hash', 'N/A')[:16] + '...' if trade.get('tx_hash') else 'N/A'
-        })
+total_trades = stats['total_trades']
+
+if total_trades:
+    # Only the current page is read from the database and sent to the browser
+    n_pages = -(-total_trades // PAGE_SIZE)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    start = (page - 1) * PAGE_SIZE
+    page_trades = _fetch_trades(limit=PAGE_SIZE, offset=start)
+    
+    # Convert to dataframe (display columns derived column-wise, not per row)
+    raw = pd.DataFrame.from_records(page_trades)
+    tx_hash = raw['tx_hash'].fillna('')
     
-    df = pd.DataFrame(trades_data)
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(raw['created_at'], format='ISO8601', errors='coerce', cache=True),
+        'Type': raw['trade_type'].str.upper(),
+        'Token In': raw['token_in'],
+        'Token Out': raw['token_out'],
+        'Amount In': raw['amount_in'],
+        'Amount Out': raw['amount_out'],
+        'Status': raw['status'],
+        'TX Hash': np.where(tx_hash != '', tx_hash.str[:16] + '...', 'N/A')
+    })
     
-    # Style status
-    def style_status(val):
-        colors = {
-            'confirmed': 'background-color: #00ff8822',
-            'pending': 'background-color: #ffaa0022',
-            'failed': 'background-color: #ff000022'
-        }
-        return colors.get(val.lower(), '')
+    # Status as emoji (no per-cell Styler)
+    df['Status'] = df['Status'].map(STATUS_ICONS).fillna(df['Status'])
+    # Arrow-backed columns hand Streamlit's Arrow serializer contiguous buffers
+    df = df.convert_dtypes(dtype_backend='pyarrow')
     
     st.dataframe(
         df,
@@ -87,8 +110,11 @@ if trades:
             "TX Hash": st.column_config.TextColumn("🔗 TX"),
         },
         hide_index=True,
-        use_container_width=True
+        use_container_width=True,
+        height=(len(df) + 1) * 35 + 3
     )
+    if n_pages > 1:
+        st.caption(f"Trades {start + 1}–{start + len(df)} sur {total_trades}")
 else:
     st.info("📭 Aucun trade enregistré")
     st.markdown("""
@@ -129,6 +155,8 @@ with st.expander("➕ Enregistrer un Trade Manuel"):
                 status='confirmed'
             )
             st.success("✅ Trade enregistré!")
+            _fetch_trades.clear()
+            _fetch_trade_stats.clear()
             st.rerun()
         except Exception as e:
             st.error(f"❌ Erreur: {e}")
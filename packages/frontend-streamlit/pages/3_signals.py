@@ -4,13 +4,19 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+import functools
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 st.set_page_config(
     page_title="📡 Signals | SmallCap Trader",
@@ -18,8 +24,33 @@ st.set_page_config(
     layout="wide"
 )
 
-st.title("📡 Signaux & Sentiment")
-st.caption("Analyse du sentiment de marché et tokens trending")
+# Fear & Greed buckets: upper bounds (inclusive) and their emoji
+FG_THRESHOLDS = (25, 45, 55, 75)
+FG_EMOJIS = ("😱", "😰", "😐", "😊", "🤑")
+
+RANK_EMOJIS = ("🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+
+# Shared sizing for the two small charts; Plotly copies these, never mutates them
+CHART_BASE_LAYOUT = dict(height=200, margin=dict(l=0, r=0, t=0, b=0))
+FG_CHART_LAYOUT = dict(
+    CHART_BASE_LAYOUT,
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    yaxis=dict(range=[0, 100], showgrid=False),
+    xaxis=dict(showgrid=False),
+    showlegend=False
+)
+DOMINANCE_CHART_LAYOUT = dict(
+    CHART_BASE_LAYOUT,
+    showlegend=True,
+    legend=dict(orientation="h", y=-0.1)
+)
+
+col_header, col_refresh = st.columns([4, 1])
+
+with col_header:
+    st.title("📡 Signaux & Sentiment")
+    st.caption("Analyse du sentiment de marché et tokens trending")
 
 # Import module
 try:
@@ -37,15 +68,205 @@ try:
     config = load_config()
 except ImportError as e:
     MODULE_AVAILABLE = False
-    config = None
     st.error(f"Module non disponible: {e}")
+    st.stop()
+
+# Import trending tracker
+try:
+    from utils.trending_tracker import (
+        get_trending_with_deltas, 
+        format_delta, 
+        format_delta_color,
+        get_snapshot_count
+    )
+    TRACKER_AVAILABLE = True
+except ImportError:
+    TRACKER_AVAILABLE = False
+
+
+# ========== CACHED FETCHES ==========
+# Every widget interaction reruns the script; these keep the external APIs
+# from being hit again until their TTL expires.
+class _NoData(Exception):
+    """Raised inside a cached fetch so st.cache_data does not store the empty result"""
+    def __init__(self, value):
+        self.value = value
+
+
+def _cache_if_data(**cache_kwargs):
+    """st.cache_data for fetches that return None/[] on API failure: empty
+    results are passed through uncached, so the next run tries the API again"""
+    def decorator(func):
+        @st.cache_data(**cache_kwargs)
+        @functools.wraps(func)
+        def cached(*args):
+            result = func(*args)
+            if not result:
+                raise _NoData(result)
+            return result
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            try:
+                return cached(*args)
+            except _NoData as e:
+                return e.value
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_source_status():
+    return get_source_status()
+
+
+@_cache_if_data(ttl=300, show_spinner=False)
+def _cached_fear_greed():
+    return get_fear_greed_index()
+
+
+@_cache_if_data(ttl=300, show_spinner=False)
+def _cached_fear_greed_history(days: int):
+    return get_fear_greed_history(days)
+
+
+@_cache_if_data(ttl=120, show_spinner=False)
+def _cached_global_market():
+    return get_global_market_data()
+
+
+@_cache_if_data(ttl=60, show_spinner=False)
+def _cached_trending():
+    return get_trending_tokens()
+
+
+@_cache_if_data(ttl=60, show_spinner=False)
+def _cached_trending_deltas():
+    return get_trending_with_deltas()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_snapshot_count():
+    return get_snapshot_count()
+
+
+@_cache_if_data(ttl=120, show_spinner=False)
+def _cached_tokens_by_market_cap(min_cap: float, max_cap: float, limit: int):
+    return get_tokens_by_market_cap(min_cap, max_cap, limit=limit)
+
+
+@_cache_if_data(ttl=300, max_entries=64, show_spinner=False)
+def _cached_social_stats(token_id: str):
+    return get_token_social_stats(token_id)
+
+
+CACHED_FETCHES = (
+    _cached_source_status,
+    _cached_fear_greed,
+    _cached_fear_greed_history,
+    _cached_global_market,
+    _cached_trending,
+    _cached_trending_deltas,
+    _cached_snapshot_count,
+    _cached_tokens_by_market_cap,
+    _cached_social_stats,
+)
+
 
-if MODULE_AVAILABLE:
-    # ========== SOURCE STATUS ==========
-    st.markdown("---")
+def _prefetch():
+    """Warm the cached fetches in parallel so a cold load waits for the slowest API, not their sum"""
+    jobs = [
+        (_cached_source_status,),
+        (_cached_fear_greed,),
+        (_cached_fear_greed_history, 30),
+        (_cached_global_market,),
+    ]
+    if TRACKER_AVAILABLE:
+        jobs += [(_cached_trending_deltas,), (_cached_snapshot_count,)]
+    else:
+        jobs.append((_cached_trending,))
+    if st.session_state.get('mcap_opened') and (config.trading.min_market_cap > 0 or config.trading.max_market_cap > 0):
+        jobs.append((_cached_tokens_by_market_cap, config.trading.min_market_cap, config.trading.max_market_cap, 50))
+    
+    # Workers share the script context so st.cache_data stores results for this session
+    with ThreadPoolExecutor(
+        max_workers=len(jobs),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as pool:
+        for fetch, *args in jobs:
+            pool.submit(fetch, *args)
+
+
+with col_refresh:
+    if st.button("🔄 Rafraîchir", use_container_width=True):
+        for fetch in CACHED_FETCHES:
+            fetch.clear()
+        st.rerun()
+
+
+@st.cache_resource(max_entries=4)
+def _fear_greed_figure(dates: tuple, values: tuple):
+    """Fear & Greed history chart, built once per distinct history"""
+    import plotly.graph_objects as go  # heavy; only imported when a chart is drawn
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=np.asarray(dates, dtype='datetime64[s]'),
+        y=np.asarray(values, dtype=np.int16),
+        fill='tozeroy',
+        line=dict(color='#667eea'),
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+    
+    # Zone colors
+    fig.add_hrect(y0=0, y1=25, fillcolor="red", opacity=0.1, line_width=0)
+    fig.add_hrect(y0=75, y1=100, fillcolor="green", opacity=0.1, line_width=0)
+    fig.add_hline(y=50, line_dash="dash", line_color="gray")
+    
+    fig.update_layout(**FG_CHART_LAYOUT)
+    return fig
+
+
+@st.cache_resource(max_entries=4)
+def _dominance_figure(btc_dom: float, eth_dom: float):
+    """BTC / ETH / altcoin dominance donut, built once per distinct split"""
+    import plotly.graph_objects as go
+    
+    alt_dom = 100 - btc_dom - eth_dom
+    fig = go.Figure(data=[go.Pie(
+        values=[btc_dom, eth_dom, alt_dom],
+        labels=['BTC', 'ETH', 'Altcoins'],
+        marker=dict(colors=['#f7931a', '#627eea', '#667eea']),
+        hole=0.5
+    )])
+    fig.update_layout(**DOMINANCE_CHART_LAYOUT)
+    return fig
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _market_cap_frame(rows: tuple) -> pd.DataFrame:
+    """Market-cap table from (rank, symbol, name, mcap, price, change_24h) rows"""
+    rank, symbol, name, mcap, price, change = zip(*rows)
+    return pd.DataFrame({
+        'Rank': pd.array(rank, dtype='Int64'),
+        'Token': symbol,
+        'Nom': [n[:20] for n in name],
+        'Market Cap': pd.array(mcap, dtype='Float64') / 1e6,
+        'Prix': pd.array(price, dtype='Float64'),
+        '24h': pd.array(change, dtype='Float64'),
+    })
+
+
+# ========== SECTIONS ==========
+# Each section is a fragment: a widget inside one only reruns that section.
+@st.fragment
+def _render_source_status():
+    """Connection status of each social data source"""
     st.subheader("🔌 Sources de Données")
     
-    status = get_source_status()
+    status = _cached_source_status()
     cols = st.columns(4)
     
     for i, (key, source) in enumerate(status.items()):
@@ -53,176 +274,122 @@ if MODULE_AVAILABLE:
             icon = "🟢" if source['connected'] else "❌"
             st.markdown(f"**{source['icon']} {source['name']}**")
             st.caption(f"{icon} {source['description']}")
+
+
+@st.fragment
+def _render_fear_greed():
+    """Fear & Greed index with its 30-day history"""
+    st.subheader("😱 Fear & Greed Index")
     
-    st.markdown("---")
-    
-    # ========== FEAR & GREED INDEX ==========
-    col_fg, col_market = st.columns([1, 1])
+    fg = _cached_fear_greed()
     
-    with col_fg:
-        st.subheader("😱 Fear & Greed Index")
+    if fg:
+        emoji = FG_EMOJIS[bisect_left(FG_THRESHOLDS, fg.value)]
         
-        fg = get_fear_greed_index()
+        # Big number display
+        with st.container(border=True):
+            st.metric(f"{emoji} {fg.classification}", f"{fg.value}/100")
+            st.progress(fg.value / 100)
         
-        if fg:
-            # Color based on value
-            if fg.value <= 25:
-                color = "#ff4444"
-                emoji = "😱"
-            elif fg.value <= 45:
-                color = "#ff8844"
-                emoji = "😰"
-            elif fg.value <= 55:
-                color = "#ffff44"
-                emoji = "😐"
-            elif fg.value <= 75:
-                color = "#88ff44"
-                emoji = "😊"
-            else:
-                color = "#44ff44"
-                emoji = "🤑"
-            
-            # Big number display
-            st.markdown(f"""
-            <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, {color}22 0%, {color}11 100%); border-radius: 15px; border: 2px solid {color};">
-                <div style="font-size: 4rem; font-weight: bold; color: {color};">{fg.value}</div>
-                <div style="font-size: 1.5rem;">{emoji} {fg.classification}</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.caption(f"Mis à jour: {fg.timestamp.strftime('%d/%m/%Y')}")
-            
-            # History chart
-            st.markdown("**Historique 30 jours**")
-            history = get_fear_greed_history(30)
-            
-            if history:
-                df_history = pd.DataFrame([
-                    {'Date': h.timestamp, 'Value': h.value, 'Label': h.classification}
-                    for h in reversed(history)
-                ])
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=df_history['Date'],
-                    y=df_history['Value'],
-                    fill='tozeroy',
-                    line=dict(color='#667eea'),
-                    fillcolor='rgba(102, 126, 234, 0.2)'
-                ))
-                
-                # Zone colors
-                fig.add_hrect(y0=0, y1=25, fillcolor="red", opacity=0.1, line_width=0)
-                fig.add_hrect(y0=75, y1=100, fillcolor="green", opacity=0.1, line_width=0)
-                fig.add_hline(y=50, line_dash="dash", line_color="gray")
-                
-                fig.update_layout(
-                    height=200,
-                    margin=dict(l=0, r=0, t=0, b=0),
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    yaxis=dict(range=[0, 100], showgrid=False),
-                    xaxis=dict(showgrid=False),
-                    showlegend=False
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("⚠️ Impossible de charger le Fear & Greed Index")
-    
-    with col_market:
-        st.subheader("🌍 Marché Global")
+        st.caption(f"Mis à jour: {fg.timestamp.strftime('%d/%m/%Y')}")
         
-        global_data = get_global_market_data()
+        # History chart
+        st.markdown("**Historique 30 jours**")
+        history = _cached_fear_greed_history(30)
         
-        if global_data:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                mcap = global_data.get('total_market_cap', 0)
-                mcap_change = global_data.get('market_cap_change_24h', 0)
-                st.metric(
-                    "Market Cap Total",
-                    f"${mcap/1e12:.2f}T",
-                    f"{mcap_change:+.2f}%"
-                )
-                
-                btc_dom = global_data.get('btc_dominance', 0)
-                st.metric("BTC Dominance", f"{btc_dom:.1f}%")
-            
-            with col2:
-                volume = global_data.get('total_volume_24h', 0)
-                st.metric("Volume 24h", f"${volume/1e9:.1f}B")
-                
-                eth_dom = global_data.get('eth_dominance', 0)
-                st.metric("ETH Dominance", f"{eth_dom:.1f}%")
+        if history:
+            # Oldest first, one column per axis (no per-row dicts)
+            dates = tuple(h.timestamp for h in reversed(history))
+            values = tuple(h.value for h in reversed(history))
             
-            # Dominance pie chart
-            fig_dom = px.pie(
-                values=[btc_dom, eth_dom, 100 - btc_dom - eth_dom],
-                names=['BTC', 'ETH', 'Altcoins'],
-                color_discrete_sequence=['#f7931a', '#627eea', '#667eea'],
-                hole=0.5
-            )
-            fig_dom.update_layout(
-                height=200,
-                margin=dict(l=0, r=0, t=0, b=0),
-                showlegend=True,
-                legend=dict(orientation="h", y=-0.1)
-            )
-            st.plotly_chart(fig_dom, use_container_width=True)
-        else:
-            st.warning("⚠️ Impossible de charger les données de marché")
+            fig = _fear_greed_figure(dates, values)
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("⚠️ Impossible de charger le Fear & Greed Index")
+
+
+@st.fragment
+def _render_global_market():
+    """Global market cap, volume and dominance"""
+    st.subheader("🌍 Marché Global")
     
-    st.markdown("---")
+    global_data = _cached_global_market()
     
-    # ========== TRENDING TOKENS WITH DELTAS ==========
+    if global_data:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            mcap = global_data.get('total_market_cap', 0)
+            mcap_change = global_data.get('market_cap_change_24h', 0)
+            st.metric(
+                "Market Cap Total",
+                f"${mcap/1e12:.2f}T",
+                f"{mcap_change:+.2f}%"
+            )
+            
+            btc_dom = global_data.get('btc_dominance', 0)
+            st.metric("BTC Dominance", f"{btc_dom:.1f}%")
+        
+        with col2:
+            volume = global_data.get('total_volume_24h', 0)
+            st.metric("Volume 24h", f"${volume/1e9:.1f}B")
+            
+            eth_dom = global_data.get('eth_dominance', 0)
+            st.metric("ETH Dominance", f"{eth_dom:.1f}%")
+        
+        # Dominance pie chart
+        fig_dom = _dominance_figure(btc_dom, eth_dom)
+        st.plotly_chart(fig_dom, use_container_width=True)
+    else:
+        st.warning("⚠️ Impossible de charger les données de marché")
+
+
+@st.fragment
+def _render_trending():
+    """CoinGecko trending tokens with rank deltas"""
     st.subheader("🔥 Trending sur CoinGecko")
     
-    # Import trending tracker
-    try:
-        from utils.trending_tracker import (
-            get_trending_with_deltas, 
-            format_delta, 
-            format_delta_color,
-            get_snapshot_count
-        )
-        TRACKER_AVAILABLE = True
-    except ImportError:
-        TRACKER_AVAILABLE = False
-    
     if TRACKER_AVAILABLE:
         with st.spinner("Chargement du trending..."):
-            trending_deltas = get_trending_with_deltas()
+            trending_deltas = _cached_trending_deltas()
         
         # Show snapshot info
-        snapshot_counts = get_snapshot_count()
+        snapshot_counts = _cached_snapshot_count()
         st.caption(f"📊 Snapshots: {snapshot_counts['24h']} (24h) | {snapshot_counts['7d']} (7j) | {snapshot_counts['total']} total")
         
         if trending_deltas:
             st.success(f"✅ {len(trending_deltas)} tokens trending chargés")
             
-            # Simple table display
-            for t in trending_deltas[:15]:
-                delta_24h_str = format_delta(t.delta_24h, t.is_new_24h)
-                delta_7d_str = format_delta(t.delta_7d, t.is_new_7d)
-                delta_30d_str = format_delta(t.delta_30d, t.is_new_30d)
-                
-                # Color for 24h delta
-                if t.is_new_24h or (t.delta_24h and t.delta_24h > 0):
-                    color = "🟢"
-                elif t.delta_24h and t.delta_24h < 0:
-                    color = "🔴"
-                else:
-                    color = "⚪"
-                
-                cols = st.columns([1, 2, 3, 2, 2, 2, 2])
-                cols[0].markdown(f"**#{t.current_rank}**")
-                cols[1].markdown(f"**{t.symbol}**")
-                cols[2].caption(t.name[:18])
-                cols[3].caption(f"Rank #{t.market_cap_rank or 'N/A'}")
-                cols[4].markdown(f"{color} {delta_24h_str}")
-                cols[5].caption(delta_7d_str)
-                cols[6].caption(delta_30d_str)
+            # Single table instead of a row of widgets per token;
+            # fields unpacked once into columns, 24h dot chosen vectorially
+            rows = trending_deltas[:15]
+            delta_24h = np.array([t.delta_24h or 0 for t in rows])
+            is_new_24h = np.fromiter((t.is_new_24h for t in rows), dtype=bool, count=len(rows))
+            dots = np.where(is_new_24h | (delta_24h > 0), "🟢", np.where(delta_24h < 0, "🔴", "⚪"))
+            
+            df_trending = pd.DataFrame({
+                'Rang': [t.current_rank for t in rows],
+                'Token': [t.symbol for t in rows],
+                'Nom': [t.name[:18] for t in rows],
+                'MCap': pd.array([t.market_cap_rank for t in rows], dtype='Int64'),
+                '24h': [f"{dot} {format_delta(t.delta_24h, t.is_new_24h)}" for dot, t in zip(dots, rows)],
+                '7j': [format_delta(t.delta_7d, t.is_new_7d) for t in rows],
+                '30j': [format_delta(t.delta_30d, t.is_new_30d) for t in rows],
+            })
+            st.dataframe(
+                df_trending,
+                column_config={
+                    "Rang": st.column_config.NumberColumn("🔥 #", format="#%d"),
+                    "Token": st.column_config.TextColumn("🪙 Token"),
+                    "Nom": st.column_config.TextColumn("📝 Nom"),
+                    "MCap": st.column_config.NumberColumn("🏆 Rank MCap", format="#%d"),
+                    "24h": st.column_config.TextColumn("📈 24h"),
+                    "7j": st.column_config.TextColumn("📅 7j"),
+                    "30j": st.column_config.TextColumn("🗓️ 30j"),
+                },
+                hide_index=True,
+                use_container_width=True
+            )
             
             # Legend
             st.markdown("---")
@@ -231,98 +398,93 @@ if MODULE_AVAILABLE:
             st.warning("⚠️ Impossible de charger les tokens trending")
     else:
         # Fallback to simple trending display
-        trending = get_trending_tokens()
+        trending = _cached_trending()
         
         if trending:
             cols = st.columns(5)
             
             for i, token in enumerate(trending[:10]):
                 with cols[i % 5]:
-                    rank_emoji = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"][i]
-                    
-                    st.markdown(f"""
-                    <div style="padding: 10px; background: linear-gradient(135deg, #2d2d44 0%, #1e1e2e 100%); border-radius: 10px; text-align: center; margin-bottom: 10px;">
-                        <div style="font-size: 1.5rem;">{rank_emoji}</div>
-                        <div style="font-weight: bold;">{token.symbol}</div>
-                        <div style="font-size: 0.8rem; color: #888;">{token.name[:15]}</div>
-                        <div style="font-size: 0.7rem; color: #666;">Rank #{token.market_cap_rank or 'N/A'}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    with st.container(border=True):
+                        st.markdown(f"{RANK_EMOJIS[i]} **{token.symbol}**")
+                        st.caption(f"{token.name[:15]} · Rank #{token.market_cap_rank or 'N/A'}")
         else:
             st.info("📭 Impossible de charger les tokens trending")
-    
-    st.markdown("---")
-    
-    # ========== TOKENS BY MARKET CAP ==========
-    if config and (config.trading.min_market_cap > 0 or config.trading.max_market_cap > 0):
-        st.subheader("🎯 Tokens dans votre fourchette")
-        
-        min_cap = config.trading.min_market_cap
-        max_cap = config.trading.max_market_cap
-        
-        cap_label = ""
-        if min_cap > 0 and max_cap > 0:
-            cap_label = f"${min_cap/1e6:.1f}M - ${max_cap/1e6:.1f}M"
-        elif min_cap > 0:
-            cap_label = f"> ${min_cap/1e6:.1f}M"
-        elif max_cap > 0:
-            cap_label = f"< ${max_cap/1e6:.1f}M"
-        
-        st.info(f"📊 Filtre Market Cap: **{cap_label}** (configurable dans Settings)")
-        
-        with st.spinner("Chargement des tokens..."):
-            filtered_tokens = get_tokens_by_market_cap(min_cap, max_cap, limit=50)
-        
-        if filtered_tokens:
-            st.caption(f"**{len(filtered_tokens)} tokens** correspondent à votre filtre")
+
+
+@st.fragment
+def _render_market_cap_filter():
+    """Tokens inside the configured market-cap range"""
+    if config.trading.min_market_cap > 0 or config.trading.max_market_cap > 0:
+        # Fetched only once the user asks for it (most visits never open it)
+        with st.expander("🎯 Tokens dans votre fourchette"):
+            min_cap = config.trading.min_market_cap
+            max_cap = config.trading.max_market_cap
             
-            # Display as table
-            import pandas as pd
-            df = pd.DataFrame([
-                {
-                    'Rank': t.get('market_cap_rank', '-'),
-                    'Token': f"{t['symbol']}",
-                    'Nom': t['name'][:20],
-                    'Market Cap': f"${t['market_cap']/1e6:.2f}M" if t.get('market_cap') else 'N/A',
-                    'Prix': f"${t['price']:.4f}" if t.get('price') else 'N/A',
-                    '24h': f"{t['price_change_24h']:+.2f}%" if t.get('price_change_24h') else 'N/A'
-                }
-                for t in filtered_tokens[:20]
-            ])
+            cap_label = ""
+            if min_cap > 0 and max_cap > 0:
+                cap_label = f"${min_cap/1e6:.1f}M - ${max_cap/1e6:.1f}M"
+            elif min_cap > 0:
+                cap_label = f"> ${min_cap/1e6:.1f}M"
+            elif max_cap > 0:
+                cap_label = f"< ${max_cap/1e6:.1f}M"
             
-            st.dataframe(
-                df,
-                column_config={
-                    "Rank": st.column_config.NumberColumn("🏆"),
-                    "Token": st.column_config.TextColumn("🪙 Token"),
-                    "Nom": st.column_config.TextColumn("📝 Nom"),
-                    "Market Cap": st.column_config.TextColumn("💰 MCap"),
-                    "Prix": st.column_config.TextColumn("💵 Prix"),
-                    "24h": st.column_config.TextColumn("📈 24h"),
-                },
-                hide_index=True,
-                use_container_width=True
-            )
-        else:
-            st.warning("⚠️ Aucun token ne correspond à votre filtre de market cap")
+            st.info(f"📊 Filtre Market Cap: **{cap_label}** (configurable dans Settings)")
+            
+            if not st.toggle("📥 Charger les tokens", key="mcap_opened"):
+                st.caption("Active pour interroger CoinGecko avec ce filtre")
+            else:
+                with st.spinner("Chargement des tokens..."):
+                    filtered_tokens = _cached_tokens_by_market_cap(min_cap, max_cap, 50)
+                
+                if filtered_tokens:
+                    st.caption(f"**{len(filtered_tokens)} tokens** correspondent à votre filtre")
+                    
+                    # Display as table (numeric columns, formatted by the frontend)
+                    df = _market_cap_frame(tuple(
+                        (t.get('market_cap_rank'), t['symbol'], t.get('name') or '',
+                         t.get('market_cap'), t.get('price'), t.get('price_change_24h'))
+                        for t in filtered_tokens[:20]
+                    ))
+                    
+                    st.dataframe(
+                        df,
+                        column_config={
+                            "Rank": st.column_config.NumberColumn("🏆"),
+                            "Token": st.column_config.TextColumn("🪙 Token"),
+                            "Nom": st.column_config.TextColumn("📝 Nom"),
+                            "Market Cap": st.column_config.NumberColumn("💰 MCap", format="$%.2fM"),
+                            "Prix": st.column_config.NumberColumn("💵 Prix", format="$%.4f"),
+                            "24h": st.column_config.NumberColumn("📈 24h", format="%+.2f%%"),
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                else:
+                    st.warning("⚠️ Aucun token ne correspond à votre filtre de market cap")
         
         st.markdown("---")
-    
-    # ========== TOKEN LOOKUP ==========
+
+
+@st.fragment
+def _render_token_lookup():
+    """Social stats lookup for a single CoinGecko ID"""
     st.subheader("🔍 Recherche Token")
     
     col_search, col_result = st.columns([1, 2])
     
     with col_search:
-        token_id = st.text_input(
+        raw_id = st.text_input(
             "CoinGecko ID",
             value="bitcoin",
             help="Ex: bitcoin, ethereum, pepe, solana..."
-        ).lower().strip()
+        )
+        # Normalized once so "Bitcoin " and "bitcoin" share one cache entry
+        token_id = raw_id.strip().lower()
         
-        if st.button("🔍 Rechercher", type="primary"):
+        if st.button("🔍 Rechercher", type="primary") and token_id:
             with st.spinner("Chargement..."):
-                stats = get_token_social_stats(token_id)
+                stats = _cached_social_stats(token_id)
                 st.session_state['token_stats'] = stats
     
     with col_result:
@@ -362,40 +524,48 @@ if MODULE_AVAILABLE:
         elif 'token_stats' in st.session_state:
             st.warning("Token non trouvé. Vérifiez l'ID CoinGecko.")
 
-    # ========== INFO ==========
-    st.markdown("---")
-    with st.expander("ℹ️ À propos des sources"):
-        st.markdown("""
-        **Sources actives :**
-        - 😱 **Fear & Greed Index** - Sentiment global du marché crypto (Alternative.me)
-        - 🦎 **CoinGecko Trending** - Top 10 tokens les plus recherchés
-        - 📊 **CoinGecko Social Stats** - Twitter, Telegram, Reddit followers par token
-        
-        **Sources non disponibles :**
-        - 🐦 **Twitter/X** - Nécessite API payante ($100+/mois depuis 2023)
-        - 📖 **Reddit** - Bloqué depuis ce serveur (anti-bot)
-        
-        **Prochaines étapes possibles :**
-        - Intégrer LunarCrush (API de sentiment social)
-        - Ajouter un bot Telegram pour scraper les groupes crypto
-        """)
 
-# Navigation
+_prefetch()
+
+st.markdown("---")
+_render_source_status()
 st.markdown("---")
-cols = st.columns(4)
 
-with cols[0]:
-    if st.button("🏠 Dashboard", use_container_width=True):
-        st.switch_page("pages/0_dashboard.py")
+col_fg, col_market = st.columns([1, 1])
+with col_fg:
+    _render_fear_greed()
+with col_market:
+    _render_global_market()
 
-with cols[1]:
-    if st.button("👛 Wallets", use_container_width=True):
-        st.switch_page("pages/1_wallet.py")
+st.markdown("---")
+_render_trending()
+st.markdown("---")
 
-with cols[2]:
-    if st.button("📝 Simulation", use_container_width=True):
-        st.switch_page("pages/8_simulation.py")
+_render_market_cap_filter()
+_render_token_lookup()
 
-with cols[3]:
-    if st.button("🐋 Whales", use_container_width=True):
-        st.switch_page("pages/7_whales.py")
+# ========== INFO ==========
+st.markdown("---")
+with st.expander("ℹ️ À propos des sources"):
+    st.markdown("""
+    **Sources actives :**
+    - 😱 **Fear & Greed Index** - Sentiment global du marché crypto (Alternative.me)
+    - 🦎 **CoinGecko Trending** - Top 10 tokens les plus recherchés
+    - 📊 **CoinGecko Social Stats** - Twitter, Telegram, Reddit followers par token
+    
+    **Sources non disponibles :**
+    - 🐦 **Twitter/X** - Nécessite API payante ($100+/mois depuis 2023)
+    - 📖 **Reddit** - Bloqué depuis ce serveur (anti-bot)
+    
+    **Prochaines étapes possibles :**
+    - Intégrer LunarCrush (API de sentiment social)
+    - Ajouter un bot Telegram pour scraper les groupes crypto
+    """)
+
+# Navigation (plain links: no rerun before switching page)
+st.markdown("---")
+cols = st.columns(4)
+cols[0].page_link("pages/0_dashboard.py", label="🏠 Dashboard", use_container_width=True)
+cols[1].page_link("pages/1_wallet.py", label="👛 Wallets", use_container_width=True)
+cols[2].page_link("pages/8_simulation.py", label="📝 Simulation", use_container_width=True)
+cols[3].page_link("pages/7_whales.py", label="🐋 Whales", use_container_width=True)
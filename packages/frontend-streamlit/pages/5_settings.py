@@ -10,7 +10,9 @@ from datetime import datetime
 import sys
 
 # Add utils to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 from utils.database import get_db
 from utils.config import (
     load_config, save_config, export_config, import_config,
@@ -23,8 +25,24 @@ st.set_page_config(
     layout="wide"
 )
 
-# ========== STYLES ==========
-st.markdown("""
+# Market cap presets: label and (min, max) range in USD, 0 = no bound
+MCAP_PRESET_LABELS = {
+    "custom": "🔧 Personnalisé",
+    "micro_cap": "🔬 Micro Cap (< $1M)",
+    "small_cap": "🎯 Small Cap ($1M - $100M)",
+    "mid_cap": "📊 Mid Cap ($100M - $1B)",
+    "large_cap": "🏛️ Large Cap (> $1B)",
+    "any": "🌐 Tous les tokens",
+}
+MCAP_PRESET_RANGES = {
+    "micro_cap": (0, 1_000_000),
+    "small_cap": (1_000_000, 100_000_000),
+    "mid_cap": (100_000_000, 1_000_000_000),
+    "large_cap": (1_000_000_000, 0),
+    "any": (0, 0),
+}
+
+SETTINGS_CSS = """
 <style>
     .settings-header {
         font-size: 2rem;
@@ -33,24 +51,11 @@ st.markdown("""
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
     }
-    .settings-section {
-        background: linear-gradient(135deg, #2d2d44 0%, #1e1e2e 100%);
-        border-radius: 15px;
-        padding: 1.5rem;
-        border: 1px solid #404060;
-        margin-bottom: 1rem;
-    }
-    .network-card {
-        background: rgba(255,255,255,0.05);
-        border-radius: 10px;
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-    }
-    .api-input {
-        font-family: monospace;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# ========== STYLES ==========
+st.markdown(SETTINGS_CSS, unsafe_allow_html=True)
 
 # ========== LOAD CONFIG ==========
 config = load_config()
@@ -314,32 +319,15 @@ with tab_trading:
         # Presets
         preset = st.selectbox(
             "Preset",
-            options=["custom", "micro_cap", "small_cap", "mid_cap", "large_cap", "any"],
-            format_func=lambda x: {
-                "custom": "🔧 Personnalisé",
-                "micro_cap": "🔬 Micro Cap (< $1M)",
-                "small_cap": "🎯 Small Cap ($1M - $100M)",
-                "mid_cap": "📊 Mid Cap ($100M - $1B)",
-                "large_cap": "🏛️ Large Cap (> $1B)",
-                "any": "🌐 Tous les tokens"
-            }[x],
+            options=list(MCAP_PRESET_LABELS),
+            format_func=MCAP_PRESET_LABELS.__getitem__,
             key="mcap_preset"
         )
         
-        # Apply preset values
-        if preset == "micro_cap":
-            min_mcap_default, max_mcap_default = 0, 1_000_000
-        elif preset == "small_cap":
-            min_mcap_default, max_mcap_default = 1_000_000, 100_000_000
-        elif preset == "mid_cap":
-            min_mcap_default, max_mcap_default = 100_000_000, 1_000_000_000
-        elif preset == "large_cap":
-            min_mcap_default, max_mcap_default = 1_000_000_000, 0
-        elif preset == "any":
-            min_mcap_default, max_mcap_default = 0, 0
-        else:
-            min_mcap_default = config.trading.min_market_cap
-            max_mcap_default = config.trading.max_market_cap
+        # Apply preset values ("custom" keeps the saved range)
+        min_mcap_default, max_mcap_default = MCAP_PRESET_RANGES.get(
+            preset, (config.trading.min_market_cap, config.trading.max_market_cap)
+        )
     
     with col_mcap2:
         max_cap_str = f"${config.trading.max_market_cap:,.0f}" if config.trading.max_market_cap > 0 else "∞ (illimité)"
@@ -544,7 +532,7 @@ with tab_export:
     
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("👛 Wallets", stats['total_wallets'])
-    col2.metric("📝 Simulation", stats['paper_trades'])
+    col2.metric("📝 Simulation", len(db.get_paper_trades()))
     col3.metric("📊 Trades", stats['total_trades'])
     col4.metric("⚡ Exécutions (24h)", stats['recent_trades_24h'])
     
@@ -6,13 +6,17 @@ Récupère les signaux, analyse et recommande BUY/SELL/HOLD
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from collections import Counter
 import sys
 import os
 import time
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 ai_path = os.path.join(os.path.dirname(__file__), '..', '..', 'ai-decision', 'python')
-sys.path.insert(0, ai_path)
+if ai_path not in sys.path:
+    sys.path.insert(0, ai_path)
 
 st.set_page_config(
     page_title="🤖 AI Analysis | SmallCap Trader",
@@ -20,6 +24,8 @@ st.set_page_config(
     layout="wide"
 )
 
+ACTION_EMOJIS = {"BUY": "🟢", "SELL": "🔴", "HOLD": "🟡"}
+
 # Imports
 try:
     from utils.social_signals import (
@@ -265,73 +271,59 @@ if 'ai_results' in st.session_state and st.session_state['ai_results']:
     # Sort by score descending
     results_sorted = sorted(results, key=lambda x: x['score'], reverse=True)
     
-    # Summary cards
-    buys = [r for r in results_sorted if r['action'] == 'BUY']
-    sells = [r for r in results_sorted if r['action'] == 'SELL']
-    holds = [r for r in results_sorted if r['action'] == 'HOLD']
+    # Summary cards (one counting pass, no per-action lists)
+    action_counts = Counter(r['action'] for r in results)
     
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown(f"""
         <div style="background: #00ff8822; padding: 15px; border-radius: 10px; text-align: center;">
-            <div style="font-size: 2rem; color: #00ff88;">🟢 {len(buys)}</div>
+            <div style="font-size: 2rem; color: #00ff88;">🟢 {action_counts['BUY']}</div>
             <div>BUY</div>
         </div>
         """, unsafe_allow_html=True)
     with col2:
         st.markdown(f"""
         <div style="background: #ffaa0022; padding: 15px; border-radius: 10px; text-align: center;">
-            <div style="font-size: 2rem; color: #ffaa00;">🟡 {len(holds)}</div>
+            <div style="font-size: 2rem; color: #ffaa00;">🟡 {action_counts['HOLD']}</div>
             <div>HOLD</div>
         </div>
         """, unsafe_allow_html=True)
     with col3:
         st.markdown(f"""
         <div style="background: #ff444422; padding: 15px; border-radius: 10px; text-align: center;">
-            <div style="font-size: 2rem; color: #ff4444;">🔴 {len(sells)}</div>
+            <div style="font-size: 2rem; color: #ff4444;">🔴 {action_counts['SELL']}</div>
             <div>SELL</div>
         </div>
         """, unsafe_allow_html=True)
     
     st.markdown("---")
     
-    # Detailed results
-    for r in results_sorted:
-        action_color = {"BUY": "#00ff88", "SELL": "#ff4444", "HOLD": "#ffaa00"}.get(r['action'], "#888")
-        action_emoji = {"BUY": "🟢", "SELL": "🔴", "HOLD": "🟡"}.get(r['action'], "❓")
-        
-        with st.container():
-            cols = st.columns([1, 2, 1, 1, 1, 3])
-            
-            with cols[0]:
-                st.markdown(f"<div style='font-size: 1.5rem;'>{action_emoji}</div>", unsafe_allow_html=True)
-            
-            with cols[1]:
-                st.markdown(f"**{r['symbol']}**")
-                st.caption(r['name'][:20])
-            
-            with cols[2]:
-                if r.get('price'):
-                    st.markdown(f"${r['price']:.4f}")
-                else:
-                    st.markdown("--")
-            
-            with cols[3]:
-                p24 = r.get('price_change_24h')
-                if p24:
-                    color = "green" if p24 > 0 else "red"
-                    st.markdown(f":{color}[{p24:+.1f}%]")
-                else:
-                    st.markdown("--")
-            
-            with cols[4]:
-                st.markdown(f"**{r['score']:.0f}**/100")
-                st.caption(f"{r['confidence']*100:.0f}% conf.")
-            
-            with cols[5]:
-                st.caption(r.get('reason', '')[:60])
-        
-        st.markdown("<hr style='margin: 5px 0; opacity: 0.2;'>", unsafe_allow_html=True)
+    # Detailed results: one table instead of a row of widgets per token
+    raw = pd.DataFrame.from_records(results_sorted).reindex(
+        columns=['action', 'symbol', 'name', 'price', 'price_change_24h', 'score', 'confidence', 'reason']
+    )
+    st.dataframe(
+        pd.DataFrame({
+            'Action': raw['action'].map(ACTION_EMOJIS).fillna('❓'),
+            'Token': raw['symbol'],
+            'Nom': raw['name'].str[:20],
+            'Prix': raw['price'].where(raw['price'] > 0),
+            '24h': raw['price_change_24h'],
+            'Score': raw['score'],
+            'Confiance': raw['confidence'] * 100,
+            'Raison': raw['reason'].fillna('').str[:60],
+        }),
+        column_config={
+            "Action": st.column_config.TextColumn("", width="small"),
+            "Prix": st.column_config.NumberColumn("💲 Prix", format="$%.4f"),
+            "24h": st.column_config.NumberColumn("📈 24h", format="%+.1f%%"),
+            "Score": st.column_config.ProgressColumn("🎯 Score", min_value=0, max_value=100, format="%.0f"),
+            "Confiance": st.column_config.NumberColumn("Conf.", format="%.0f%%"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
     
     # Export
     st.markdown("---")
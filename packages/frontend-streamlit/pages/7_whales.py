@@ -8,10 +8,17 @@ import os
 from datetime import datetime, timedelta
 import json
 import time
+import heapq
+from itertools import chain
+from operator import itemgetter
 
 # Add paths
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'copy-trader'))
+for _path in (
+    os.path.dirname(os.path.dirname(__file__)),
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'copy-trader'),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from utils.config import SUPPORTED_NETWORKS, load_config
 from utils.database import get_db
@@ -27,26 +34,8 @@ st.set_page_config(
 config = load_config()
 db = get_db()
 
-# Custom CSS
-st.markdown("""
+WHALES_CSS = """
 <style>
-    .whale-card {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-        border: 1px solid #0f3460;
-    }
-    .whale-name {
-        font-size: 1.2rem;
-        font-weight: bold;
-        color: #e94560;
-    }
-    .whale-address {
-        font-family: monospace;
-        color: #888;
-        font-size: 0.85rem;
-    }
     .tx-buy {
         color: #00ff88;
         font-weight: bold;
@@ -55,19 +44,11 @@ st.markdown("""
         color: #ff4444;
         font-weight: bold;
     }
-    .alert-high {
-        border-left: 4px solid #ff4444;
-        padding-left: 10px;
-    }
-    .alert-medium {
-        border-left: 4px solid #ffaa00;
-        padding-left: 10px;
-    }
-    .copy-button {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Custom CSS
+st.markdown(WHALES_CSS, unsafe_allow_html=True)
 
 # Title
 st.title("🐋 Whale Tracker")
@@ -146,14 +127,16 @@ with tab1:
                 )
             
             # Display whales
+            tracked_addresses = {w['address'] for w in st.session_state.tracked_whales}
+            search_lower = search.lower()
             displayed = 0
             for address, info in whales.items():
-                # Apply filters
-                if search:
-                    if search.lower() not in info['name'].lower() and search.lower() not in address.lower():
-                        continue
+                # Apply filters (cheap type check before substring search)
                 if type_filter != "All" and info.get('type') != type_filter:
                     continue
+                if search_lower:
+                    if search_lower not in info['name'].lower() and search_lower not in address.lower():
+                        continue
                 
                 displayed += 1
                 
@@ -187,9 +170,7 @@ with tab1:
                     
                     with col2:
                         # Check if already tracking
-                        is_tracking = address in [w['address'] for w in st.session_state.tracked_whales]
-                        
-                        if is_tracking:
+                        if address in tracked_addresses:
                             if st.button("🚫 Untrack", key=f"untrack_{address}"):
                                 st.session_state.tracked_whales = [
                                     w for w in st.session_state.tracked_whales 
@@ -356,18 +337,23 @@ with tab3:
         st.info("Click 'Refresh All' in the Tracking tab to fetch transactions")
     else:
         # Combine and sort all transactions
-        all_txs = []
-        for address, txs in st.session_state.whale_transactions.items():
-            whale_info = next(
-                (w for w in st.session_state.tracked_whales if w['address'] == address),
-                {'name': address[:10] + '...', 'address': address}
-            )
+        def _tag(txs, whale_name):
             for tx in txs:
-                tx['whale_name'] = whale_info['name']
-                all_txs.append(tx)
+                tx['whale_name'] = whale_name
+                tx.setdefault('timestamp', '')
+            return txs
         
-        # Sort by timestamp
-        all_txs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        # First tracked entry wins for duplicated addresses
+        whale_names = {w['address']: w['name'] for w in reversed(st.session_state.tracked_whales)}
+        # Only the 50 most recent are shown: bounded selection instead of a full sort
+        recent_txs = heapq.nlargest(
+            50,
+            chain.from_iterable(
+                _tag(txs, whale_names.get(address, address[:10] + '...'))
+                for address, txs in st.session_state.whale_transactions.items()
+            ),
+            key=itemgetter('timestamp')
+        )
         
         # Filters
         col1, col2, col3 = st.columns(3)
@@ -378,20 +364,23 @@ with tab3:
         with col3:
             filter_token = st.text_input("Token Symbol", "")
         
+        # Skip per-row filtering entirely when every filter is left on its default
+        filters_active = filter_type != "All" or filter_direction != "All" or bool(filter_token)
+        want_swap = filter_type == "Swaps Only"
+        want_direction = filter_direction.lower()
+        want_token = filter_token.upper()
+        
         # Display transactions
         displayed = 0
-        for tx in all_txs[:50]:
+        for tx in recent_txs:
             # Apply filters
-            if filter_type == "Swaps Only" and not tx.get('is_swap'):
-                continue
-            if filter_type == "Transfers Only" and tx.get('is_swap'):
-                continue
-            if filter_direction == "Buy" and tx.get('swap_direction') != "buy":
-                continue
-            if filter_direction == "Sell" and tx.get('swap_direction') != "sell":
-                continue
-            if filter_token and filter_token.upper() not in tx.get('token_symbol', '').upper():
-                continue
+            if filters_active:
+                if filter_type != "All" and bool(tx.get('is_swap')) != want_swap:
+                    continue
+                if filter_direction != "All" and tx.get('swap_direction') != want_direction:
+                    continue
+                if want_token and want_token not in tx.get('token_symbol', '').upper():
+                    continue
             
             displayed += 1
             
@@ -422,10 +411,10 @@ with tab3:
                 with col3:
                     timestamp = tx.get('timestamp', '')
                     if timestamp:
-                        try:
-                            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                            st.caption(dt.strftime('%m/%d %H:%M'))
-                        except:
+                        # ISO-8601 strings: slice MM/DD HH:MM directly instead of parsing per row
+                        if timestamp[4:5] == '-' and timestamp[10:11] in ('T', ' '):
+                            st.caption(f"{timestamp[5:7]}/{timestamp[8:10]} {timestamp[11:16]}")
+                        else:
                             st.caption(timestamp[:16])
                 
                 with col4:
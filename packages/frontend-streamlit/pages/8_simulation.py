@@ -9,7 +9,9 @@ import os
 from datetime import datetime
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 st.set_page_config(
     page_title="📝 Trading Auto | SmallCap Trader",
@@ -22,6 +24,7 @@ try:
     from utils.config import load_config, AI_PROFILES
     from utils.llm_providers import get_available_providers, LLM_MODELS, call_llm
     from utils.database import get_db
+    from utils.sim_history import history_frame
     import requests
     MODULES_OK = True
 except ImportError as e:
@@ -29,6 +32,12 @@ except ImportError as e:
     st.error(f"❌ {e}")
     st.stop()
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 SIM_DB_PATH = os.path.join(DATA_DIR, 'simulation.json')
@@ -49,6 +58,19 @@ CHAINS = {
     'bsc': '🟡 BSC',
 }
 
+# Symbol -> CoinGecko id for common tokens (others are tried as lowercase id, then searched)
+COINGECKO_IDS = {
+    'BTC': 'bitcoin', 'ETH': 'ethereum', 'SOL': 'solana', 
+    'PEPE': 'pepe', 'DOGE': 'dogecoin', 'XRP': 'ripple',
+    'ADA': 'cardano', 'AVAX': 'avalanche-2', 'LINK': 'chainlink',
+    'DOT': 'polkadot', 'MATIC': 'matic-network', 'SHIB': 'shiba-inu',
+    'UNI': 'uniswap', 'ATOM': 'cosmos', 'LTC': 'litecoin',
+    'BRETT': 'brett', 'XVG': 'verge', 'SUI': 'sui',
+    'ARB': 'arbitrum', 'OP': 'optimism', 'APT': 'aptos',
+    'INJ': 'injective-protocol', 'SEI': 'sei-network',
+    'WIF': 'dogwifcoin', 'BONK': 'bonk', 'FLOKI': 'floki',
+}
+
 FREQUENCIES = {
     '15min': {'name': '⏱️ 15 minutes', 'cron': '*/15 * * * *', 'ms': 15*60*1000},
     '1h': {'name': '⏱️ 1 heure', 'cron': '0 * * * *', 'ms': 60*60*1000},
@@ -57,11 +79,22 @@ FREQUENCIES = {
     'off': {'name': '⏸️ Désactivé', 'cron': None, 'ms': 0},
 }
 
+ACTION_EMOJIS = {'BUY': '🟢', 'SELL': '🔴', 'HOLD': '🟡'}
+
+
+@st.cache_data(max_entries=8)
+def _load_json(path: str, mtime_ns: int):
+    """Parsed JSON file, memoized until the file's mtime changes"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
 def load_sim():
     if os.path.exists(SIM_DB_PATH):
-        with open(SIM_DB_PATH, 'r') as f:
-            return json.load(f)
+        return _load_json(SIM_DB_PATH, os.stat(SIM_DB_PATH).st_mtime_ns)
     return {'portfolio': {'USD': 10000}, 'positions': {}, 'history': []}
 
 
@@ -73,8 +106,7 @@ def save_sim(data):
 
 def load_bot_config():
     if os.path.exists(BOT_CONFIG_PATH):
-        with open(BOT_CONFIG_PATH, 'r') as f:
-            return json.load(f)
+        return _load_json(BOT_CONFIG_PATH, os.stat(BOT_CONFIG_PATH).st_mtime_ns)
     return {'enabled': False, 'frequency': 'off', 'mcap': 'small', 'chain': 'base', 'profile': 'modere', 'provider': 'openclaw'}
 
 
@@ -87,19 +119,7 @@ def save_bot_config(cfg):
 def get_price(symbol: str) -> float:
     """Get price from CoinGecko - tries symbol mapping then search"""
     try:
-        # Common mappings
-        maps = {
-            'BTC': 'bitcoin', 'ETH': 'ethereum', 'SOL': 'solana', 
-            'PEPE': 'pepe', 'DOGE': 'dogecoin', 'XRP': 'ripple',
-            'ADA': 'cardano', 'AVAX': 'avalanche-2', 'LINK': 'chainlink',
-            'DOT': 'polkadot', 'MATIC': 'matic-network', 'SHIB': 'shiba-inu',
-            'UNI': 'uniswap', 'ATOM': 'cosmos', 'LTC': 'litecoin',
-            'BRETT': 'brett', 'XVG': 'verge', 'SUI': 'sui',
-            'ARB': 'arbitrum', 'OP': 'optimism', 'APT': 'aptos',
-            'INJ': 'injective-protocol', 'SEI': 'sei-network',
-            'WIF': 'dogwifcoin', 'BONK': 'bonk', 'FLOKI': 'floki',
-        }
-        cg_id = maps.get(symbol.upper(), symbol.lower())
+        cg_id = COINGECKO_IDS.get(symbol.upper(), symbol.lower())
         
         r = requests.get(
             'https://api.coingecko.com/api/v3/simple/price', 
@@ -130,6 +150,32 @@ def get_price(symbol: str) -> float:
         return 0
 
 
+def get_prices(symbols) -> dict:
+    """Prices for several symbols in one CoinGecko call; unresolved ones fall back to get_price()"""
+    ids = {s: COINGECKO_IDS.get(s.upper(), s.lower()) for s in symbols}
+    prices = {}
+    if ids:
+        try:
+            r = requests.get(
+                'https://api.coingecko.com/api/v3/simple/price',
+                params={'ids': ','.join(set(ids.values())), 'vs_currencies': 'usd'},
+                timeout=10
+            )
+            data = r.json()
+            prices = {s: data[cg_id]['usd'] for s, cg_id in ids.items() if data.get(cg_id, {}).get('usd')}
+        except Exception:
+            pass
+    for s in ids.keys() - prices.keys():
+        prices[s] = get_price(s)
+    return prices
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_prices(symbols: tuple) -> dict:
+    """Position prices, shared across reruns for up to a minute"""
+    return get_prices(symbols)
+
+
 def trade(sim, action, symbol, amount_usd, price):
     ts = datetime.now().isoformat()
     if action == 'BUY' and sim['portfolio'].get('USD', 0) >= amount_usd and price > 0:
@@ -163,10 +209,13 @@ bot_cfg = load_bot_config()
 config = load_config()
 providers = get_available_providers()
 
+# Position prices expire after the cache TTL; refetched on demand or when positions change
+prices = _fetch_prices(tuple(sorted(sim['positions'])))
+
 # Portfolio summary
 col1, col2, col3, col4 = st.columns(4)
 usd = sim['portfolio'].get('USD', 0)
-pos_val = sum(p['amount'] * get_price(s) for s, p in sim['positions'].items())
+pos_val = sum(p['amount'] * prices.get(s, 0) for s, p in sim['positions'].items())
 total = usd + pos_val
 
 col1.metric("💰 Total", f"${total:,.0f}")
@@ -178,8 +227,11 @@ bot_status = "🟢 Actif" if bot_cfg.get('enabled') and bot_cfg.get('frequency')
 col4.metric("🤖 Bot", bot_status)
 
 if sim['positions']:
+    if st.button("🔄 Rafraîchir les prix"):
+        _fetch_prices.clear()
+        st.rerun()
     for s, p in sim['positions'].items():
-        px = get_price(s)
+        px = prices.get(s, 0)
         pnl = (px - p['avg_price']) * p['amount']
         st.caption(f"• {s}: {p['amount']:.4f} @ ${p['avg_price']:.4f} → ${px:.4f} ({'+' if pnl>=0 else ''}{pnl:.2f}$)")
 
@@ -317,7 +369,7 @@ Si rien d'intéressant: []
                         conf = d.get('confidence', 0)
                         reason = d.get('reason', '')
                         
-                        emoji = {'BUY': '🟢', 'SELL': '🔴', 'HOLD': '🟡'}.get(act, '⚪')
+                        emoji = ACTION_EMOJIS.get(act, '⚪')
                         st.markdown(f"{emoji} **{act} {sym}** ({conf}%) - {reason}")
                         
                         # Execute BUY if confidence >= min_score
@@ -341,14 +393,23 @@ Si rien d'intéressant: []
 # ========== HISTORY ==========
 st.markdown("---")
 with st.expander("📜 Historique"):
-    for h in sim.get('history', [])[-20:][::-1]:
-        em = '🟢' if h.get('action') == 'BUY' else '🔴'
-        pnl = f" PnL: {h.get('pnl',0):+.2f}$" if 'pnl' in h else ""
-        ts = h.get('ts') or h.get('timestamp', '?')
-        qty = h.get('qty') or h.get('amount', 0)
-        symbol = h.get('symbol', '?')
-        price = h.get('price', 0)
-        st.caption(f"{str(ts)[:16]} {em} {h.get('action','?')} {symbol} {qty:.4f} @ ${price:.4f}{pnl}")
+    history = sim.get('history', [])
+    if history:
+        # One table for the whole history (rows are virtualized by the frontend)
+        df_history = history_frame(history)
+        st.dataframe(
+            df_history,
+            column_config={
+                "Quantité": st.column_config.NumberColumn(format="%.4f"),
+                "Prix": st.column_config.NumberColumn(format="$%.4f"),
+                "PnL": st.column_config.NumberColumn(format="%+.2f$"),
+            },
+            hide_index=True,
+            use_container_width=True,
+            height=400
+        )
+    else:
+        st.caption("📭 Aucun trade")
 
 # Reset
 if st.button("🔄 Reset Simulation"):
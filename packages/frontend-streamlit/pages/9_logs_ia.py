@@ -8,7 +8,9 @@ from datetime import datetime
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_root = os.path.join(os.path.dirname(__file__), '..')
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 st.set_page_config(
     page_title="📜 Logs IA | SmallCap Trader",
@@ -16,6 +18,8 @@ st.set_page_config(
     layout="wide"
 )
 
+PAGE_SIZE = 10
+
 try:
     from utils.llm_providers import get_llm_logs, get_available_providers, LLM_MODELS
     MODULES_OK = True
@@ -76,7 +80,15 @@ OPENAI_API_KEY=sk-...
     if logs:
         st.success(f"📊 {len(logs)} appels enregistrés")
         
-        for i, log in enumerate(logs):
+        # Expanders render their content even when collapsed: only build one page of them
+        n_pages = -(-len(logs) // PAGE_SIZE)
+        page = 1
+        if n_pages > 1:
+            with col2:
+                page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+        start = (page - 1) * PAGE_SIZE
+        
+        for i, log in enumerate(logs[start:start + PAGE_SIZE], start=start):
             # Format timestamp
             try:
                 ts = datetime.fromisoformat(log['timestamp']).strftime('%d/%m %H:%M:%S')
@@ -109,6 +121,8 @@ OPENAI_API_KEY=sk-...
                 # Response
                 st.markdown("**💬 Réponse:**")
                 st.code(log['response'], language=None)
+        if n_pages > 1:
+            st.caption(f"Logs {start + 1}–{min(start + PAGE_SIZE, len(logs))} sur {len(logs)}")
     else:
         st.info("📭 Aucun log pour le moment. Lance une analyse IA pour voir les logs!")
 
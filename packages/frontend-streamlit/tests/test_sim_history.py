@@ -0,0 +1,54 @@
+"""
+Tests for the simulation history table.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim_history import history_frame
+
+
+def test_newest_first():
+    df = history_frame([
+        {'ts': '2024-01-01T10:00:00', 'action': 'BUY', 'symbol': 'PEPE', 'qty': 1.0, 'price': 0.1},
+        {'ts': '2024-01-02T10:00:00', 'action': 'SELL', 'symbol': 'PEPE', 'qty': 1.0, 'price': 0.2, 'pnl': 0.1},
+    ])
+    assert list(df['Date']) == ['2024-01-02 10:00', '2024-01-01 10:00']
+    assert list(df['Action']) == ['🔴 SELL', '🟢 BUY']
+
+
+def test_legacy_entries_only():
+    """Entries without ts/qty fall back to timestamp/amount"""
+    df = history_frame([
+        {'timestamp': '2023-12-31 09:30:00', 'action': 'BUY', 'symbol': 'DOGE', 'amount': 12.5, 'price': 0.08},
+        {'timestamp': '2024-01-01 09:30:00', 'action': 'SELL', 'symbol': 'DOGE', 'amount': 12.5, 'price': 0.09},
+    ])
+    assert list(df['Date']) == ['2024-01-01 09:30', '2023-12-31 09:30']
+    assert list(df['Quantité']) == [12.5, 12.5]
+
+
+def test_mixed_entries():
+    df = history_frame([
+        {'timestamp': '2023-12-31 09:30:00', 'action': 'BUY', 'symbol': 'DOGE', 'amount': 3.0},
+        {'ts': '2024-01-01T10:00:00', 'action': 'BUY', 'symbol': 'PEPE', 'qty': 2.0},
+    ])
+    assert list(df['Date']) == ['2024-01-01 10:00', '2023-12-31 09:30']
+    assert list(df['Quantité']) == [2.0, 3.0]
+
+
+def test_zero_qty_falls_back_to_amount():
+    """A qty of 0 is treated as missing, like `h.get('qty') or h.get('amount', 0)`"""
+    df = history_frame([
+        {'ts': '', 'timestamp': '2024-01-01 09:30:00', 'action': 'BUY', 'qty': 0, 'amount': 4.0},
+        {'ts': '2024-01-02T10:00:00', 'action': 'BUY', 'qty': 0},
+    ])
+    assert list(df['Date']) == ['2024-01-02 10:00', '2024-01-01 09:30']
+    assert list(df['Quantité']) == [0.0, 4.0]
+
+
+def test_missing_columns_use_defaults():
+    df = history_frame([{'price': 1.0}])
+    assert df.loc[0, 'Date'] == '?'
+    assert df.loc[0, 'Action'] == '🔴 ?'
+    assert df.loc[0, 'Token'] == '?'
+    assert df.loc[0, 'Quantité'] == 0.0
@@ -9,6 +9,7 @@ import os
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 import time
 
 # ========== CONFIG ==========
@@ -180,12 +181,17 @@ def fetch_coingecko_tokens(limit: int = 1000) -> Dict[str, List[TokenInfo]]:
         print(f"Error fetching CoinGecko tokens: {e}")
         return tokens_by_network
 
+@lru_cache(maxsize=1)
+def _read_tokens_cache(path: str, mtime_ns: int) -> Dict:
+    """Parsed token cache file, memoized until the file is rewritten"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
 def load_tokens_cache() -> Optional[Dict]:
     """Load tokens from cache file"""
     try:
         if os.path.exists(TOKENS_CACHE_FILE):
-            with open(TOKENS_CACHE_FILE, 'r') as f:
-                data = json.load(f)
+            data = _read_tokens_cache(TOKENS_CACHE_FILE, os.stat(TOKENS_CACHE_FILE).st_mtime_ns)
             
             # Check if cache is fresh
             cached_at = datetime.fromisoformat(data.get('cached_at', '2000-01-01'))
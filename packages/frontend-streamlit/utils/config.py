@@ -3,11 +3,13 @@ Crypto SmallCap Trader - Configuration Management
 Export/Import configuration, API keys, etc.
 """
 
+import copy
 import json
 import os
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from functools import lru_cache
 
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
@@ -195,13 +197,20 @@ class AppConfig:
         return config
 
 
+@lru_cache(maxsize=4)
+def _read_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parsed config file, memoized until the file changes on disk"""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
 def load_config(config_path: str = CONFIG_PATH) -> AppConfig:
     """Load configuration from file"""
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-            return AppConfig.from_dict(data)
+            data = _read_config(config_path, os.stat(config_path).st_mtime_ns)
+            # Callers mutate and save the returned config: never share the cached dict
+            return AppConfig.from_dict(copy.deepcopy(data))
         except Exception as e:
             print(f"Error loading config: {e}")
     return AppConfig()
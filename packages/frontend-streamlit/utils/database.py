@@ -11,8 +11,24 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'trader.db')
+SIM_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'simulation.json')
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
 
 
 @dataclass
@@ -57,9 +73,23 @@ class Database:
     
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        self._version = 0
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self._init_db()
     
+    @property
+    def data_version(self) -> int:
+        """Bumped after every committed write; use it as a cache key for reads"""
+        return self._version
+    
+    @property
+    def paper_version(self) -> int:
+        """mtime of simulation.json (0 if missing); changes whenever paper trades are saved"""
+        try:
+            return os.stat(SIM_PATH).st_mtime_ns
+        except OSError:
+            return 0
+    
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
@@ -68,6 +98,8 @@ class Database:
         try:
             yield conn
             conn.commit()
+            if conn.total_changes:
+                self._version += 1
         except Exception:
             conn.rollback()
             raise
@@ -181,6 +213,15 @@ class Database:
                     UNIQUE(token)
                 )
             ''')
+            
+            # Indexes for the ORDER BY / WHERE columns of the listing queries
+            cursor.executescript('''
+                CREATE INDEX IF NOT EXISTS idx_strategies_created_at ON strategies(created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_strategies_wallet ON strategies(wallet_id);
+                CREATE INDEX IF NOT EXISTS idx_executions_executed_at ON strategy_executions(executed_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_executions_strategy ON strategy_executions(strategy_id);
+                CREATE INDEX IF NOT EXISTS idx_trades_created_at ON trades(created_at DESC);
+            ''')
     
     # ========== WALLET METHODS ==========
     
@@ -365,24 +406,27 @@ class Database:
     
     def add_trade(self, wallet_id: int, trade_type: str, token_in: str, token_out: str,
                   amount_in: str, amount_out: Optional[str] = None, price_usd: Optional[float] = None,
-                  strategy_id: Optional[int] = None, tx_hash: Optional[str] = None) -> int:
+                  strategy_id: Optional[int] = None, tx_hash: Optional[str] = None,
+                  status: str = 'pending') -> int:
         """Record a trade"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                INSERT INTO trades (wallet_id, strategy_id, tx_hash, trade_type, token_in, token_out, amount_in, amount_out, price_usd)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (wallet_id, strategy_id, tx_hash, trade_type, token_in, token_out, amount_in, amount_out, price_usd))
+                INSERT INTO trades (wallet_id, strategy_id, tx_hash, trade_type, token_in, token_out, amount_in, amount_out, price_usd, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (wallet_id, strategy_id, tx_hash, trade_type, token_in, token_out, amount_in, amount_out, price_usd, status))
             return cursor.lastrowid
     
-    def get_trades(self, wallet_id: Optional[int] = None, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get trade history"""
+    def get_trades(self, wallet_id: Optional[int] = None, limit: int = 50,
+                   offset: int = 0) -> List[Dict[str, Any]]:
+        """Get trade history (most recent first, paged with limit/offset)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             if wallet_id:
-                cursor.execute('SELECT * FROM trades WHERE wallet_id = ? ORDER BY created_at DESC LIMIT ?', (wallet_id, limit))
+                cursor.execute('SELECT * FROM trades WHERE wallet_id = ? ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?',
+                               (wallet_id, limit, offset))
             else:
-                cursor.execute('SELECT * FROM trades ORDER BY created_at DESC LIMIT ?', (limit,))
+                cursor.execute('SELECT * FROM trades ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?', (limit, offset))
             return [dict(row) for row in cursor.fetchall()]
     
     # ========== SETTINGS ==========
@@ -501,11 +545,9 @@ class Database:
     
     def get_paper_trades(self) -> List[Dict[str, Any]]:
         """Get paper trades from simulation.json"""
-        sim_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'simulation.json')
         try:
-            if os.path.exists(sim_path):
-                with open(sim_path, 'r') as f:
-                    data = json.load(f)
+            if os.path.exists(SIM_PATH):
+                data = _read_json(SIM_PATH)
                 return data.get('trades', [])
         except (json.JSONDecodeError, IOError):
             pass
@@ -513,46 +555,54 @@ class Database:
     
     def get_paper_portfolio(self) -> Dict[str, Any]:
         """Get full paper trading portfolio from simulation.json"""
-        sim_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'simulation.json')
         try:
-            if os.path.exists(sim_path):
-                with open(sim_path, 'r') as f:
-                    return json.load(f)
+            if os.path.exists(SIM_PATH):
+                return _read_json(SIM_PATH)
         except (json.JSONDecodeError, IOError):
             pass
         return {'balance_usd': 10000, 'positions': {}, 'trades': []}
     
     # ========== STATS ==========
     
+    def get_trade_stats(self) -> Dict[str, Any]:
+        """Get trade counters only (total and last 24h)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    COUNT(*) AS total_trades,
+                    COALESCE(SUM(created_at > datetime('now', '-1 day')), 0) AS recent_trades
+                FROM trades
+            ''')
+            row = cursor.fetchone()
+            return {
+                'total_trades': row['total_trades'],
+                'recent_trades_24h': row['recent_trades']
+            }
+    
     def get_portfolio_stats(self) -> Dict[str, Any]:
         """Get aggregate portfolio statistics"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Total wallets
-            cursor.execute('SELECT COUNT(*) as count FROM wallets')
-            total_wallets = cursor.fetchone()['count']
-            
-            # Active strategies
-            cursor.execute('SELECT COUNT(*) as count FROM strategies WHERE is_active = 1')
-            active_strategies = cursor.fetchone()['count']
-            
-            # Total trades
-            cursor.execute('SELECT COUNT(*) as count FROM trades')
-            total_trades = cursor.fetchone()['count']
-            
-            # Recent trades (24h)
+
+            # All counters in a single round-trip
             cursor.execute('''
-                SELECT COUNT(*) as count FROM trades 
-                WHERE created_at > datetime('now', '-1 day')
+                SELECT
+                    (SELECT COUNT(*) FROM wallets) AS total_wallets,
+                    (SELECT COUNT(*) FROM wallets WHERE is_active = 1) AS active_wallets,
+                    (SELECT COUNT(*) FROM strategies WHERE is_active = 1) AS active_strategies,
+                    COUNT(*) AS total_trades,
+                    COALESCE(SUM(created_at > datetime('now', '-1 day')), 0) AS recent_trades
+                FROM trades
             ''')
-            recent_trades = cursor.fetchone()['count']
-            
+            row = cursor.fetchone()
+
             return {
-                'total_wallets': total_wallets,
-                'active_strategies': active_strategies,
-                'total_trades': total_trades,
-                'recent_trades_24h': recent_trades
+                'total_wallets': row['total_wallets'],
+                'active_wallets': row['active_wallets'],
+                'active_strategies': row['active_strategies'],
+                'total_trades': row['total_trades'],
+                'recent_trades_24h': row['recent_trades']
             }
 
 
@@ -0,0 +1,37 @@
+"""
+Simulation history table
+Builds the display frame for the simulation page's history expander.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+def _first_set(raw: pd.DataFrame, column: str, fallback: str, default: Any) -> pd.Series:
+    """Column-wise `h.get(column) or h.get(fallback, default)`: falsy values count as missing"""
+    result = pd.Series(np.nan, index=raw.index, dtype=object)
+    for name in (fallback, column):
+        if name in raw:
+            values = raw[name]
+            is_set = values.notna() & values.astype(bool)
+            result = values.where(is_set, result)
+    return result.fillna(default)
+
+
+def history_frame(history: List[Dict[str, Any]]) -> pd.DataFrame:
+    """History entries (newest first) as the Date/Action/Token/Quantité/Prix/PnL table.
+    Older entries carry `timestamp`/`amount` instead of `ts`/`qty`."""
+    raw = pd.DataFrame.from_records(history[::-1])
+    ts = _first_set(raw, 'ts', 'timestamp', '?')
+    qty = _first_set(raw, 'qty', 'amount', 0)
+    action = raw['action'].fillna('?') if 'action' in raw else pd.Series('?', index=raw.index)
+    return pd.DataFrame({
+        'Date': ts.astype(str).str.slice(0, 16).str.replace('T', ' ', regex=False),
+        'Action': np.where(action == 'BUY', '🟢 ', '🔴 ') + action,
+        'Token': raw['symbol'].fillna('?') if 'symbol' in raw else '?',
+        'Quantité': pd.to_numeric(qty, errors='coerce').fillna(0.0),
+        'Prix': raw['price'].fillna(0) if 'price' in raw else 0.0,
+        'PnL': raw['pnl'] if 'pnl' in raw else None,
+    })
@@ -7,12 +7,14 @@ Sources:
 - Future: Twitter/X, Telegram (require API keys)
 """
 
+import heapq
 import re
 import time
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
+from operator import itemgetter
 from dataclasses import dataclass
 import logging
 
@@ -509,12 +511,12 @@ def get_trending_tokens(limit: int = 10, db=None) -> List[Dict[str, Any]]:
             ]
         })
     
-    # Sort by hype score and return top N
-    results.sort(key=lambda x: x['hype_score'], reverse=True)
+    # Top N by hype score (partial selection, no full sort)
+    results = heapq.nlargest(limit, results, key=itemgetter('hype_score'))
     
     # Save to DB if available
     if db:
-        for r in results[:limit]:
+        for r in results:
             try:
                 db.update_token_trend(
                     token=r['token'],
@@ -526,7 +528,7 @@ def get_trending_tokens(limit: int = 10, db=None) -> List[Dict[str, Any]]:
             except Exception as e:
                 logger.error(f"Failed to save token trend: {e}")
     
-    return results[:limit]
+    return results
 
 
 def get_sentiment(token_symbol: str, db=None) -> Dict[str, Any]:
@@ -687,10 +689,8 @@ def get_recent_signals(limit: int = 20, db=None) -> List[Dict[str, Any]]:
                 except Exception as e:
                     logger.error(f"Failed to save signal: {e}")
     
-    # Sort by hype score
-    signals.sort(key=lambda x: x['hype_score'], reverse=True)
-    
-    return signals[:limit]
+    # Top N by hype score
+    return heapq.nlargest(limit, signals, key=itemgetter('hype_score'))
 
 
 def get_source_status() -> Dict[str, Any]:
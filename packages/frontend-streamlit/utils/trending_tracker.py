@@ -81,11 +81,11 @@ def save_snapshot(tokens: List[Dict]):
     conn.close()
 
 
-def get_snapshot_at(hours_ago: int) -> Optional[Dict]:
-    """Get the closest snapshot from X hours ago"""
+def get_snapshot_at(hours_ago: int, now: Optional[datetime] = None) -> Optional[Dict]:
+    """Get the closest snapshot from X hours ago (relative to `now`, default: current time)"""
     conn = get_db()
     
-    target_time = datetime.now() - timedelta(hours=hours_ago)
+    target_time = (now or datetime.now()) - timedelta(hours=hours_ago)
     # Allow 2 hour window
     min_time = target_time - timedelta(hours=2)
     max_time = target_time + timedelta(hours=2)
@@ -120,10 +120,11 @@ def get_token_rank_from_snapshot(snapshot: Dict, symbol: str) -> Optional[int]:
 def calculate_deltas(current_tokens: List[Dict]) -> List[TrendingDelta]:
     """Calculate trending position deltas for current tokens"""
     
-    # Get historical snapshots
-    snapshot_24h = get_snapshot_at(24)
-    snapshot_7d = get_snapshot_at(24 * 7)
-    snapshot_30d = get_snapshot_at(24 * 30)
+    # Get historical snapshots (one reference time for all three windows)
+    now = datetime.now()
+    snapshot_24h = get_snapshot_at(24, now)
+    snapshot_7d = get_snapshot_at(24 * 7, now)
+    snapshot_30d = get_snapshot_at(24 * 30, now)
     
     results = []
     